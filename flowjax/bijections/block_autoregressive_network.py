@@ -1,6 +1,7 @@
 """Block Neural Autoregressive bijection implementation."""
 
 from collections.abc import Callable
+from functools import partial
 from math import prod
 from typing import ClassVar
 
@@ -14,6 +15,7 @@ from jaxtyping import PRNGKeyArray
 
 from flowjax import masks
 from flowjax.bijections.bijection import AbstractBijection
+from flowjax.bijections.jax_transforms import _filter_scan
 from flowjax.bijections.tanh import LeakyTanh
 from flowjax.bisection_search import AutoregressiveBisectionInverter
 from flowjax.wrappers import Parameterize, WeightNormalization
@@ -54,6 +56,10 @@ class BlockAutoregressiveNetwork(AbstractBijection):
     activation is the set of real values, which will ensure properly normalized
     densities (see https://github.com/danielward27/flowjax/issues/102).
 
+    As with other bijections, the methods are not compiled. If calling the methods
+    outside of a jitted function, consider wrapping the call with ``eqx.filter_jit``
+    to avoid dispatching each operation separately.
+
     Args:
         key: Jax key
         dim: Dimension of the distribution.
@@ -76,6 +82,7 @@ class BlockAutoregressiveNetwork(AbstractBijection):
     cond_shape: tuple[int, ...] | None
     depth: int
     layers: list
+    hidden_layers: tuple[eqx.nn.Linear, Callable] | None
     cond_linear: eqx.nn.Linear | None
     block_dim: int
     activation: AbstractBijection
@@ -106,35 +113,36 @@ class BlockAutoregressiveNetwork(AbstractBijection):
             AutoregressiveBisectionInverter() if inverter is None else inverter
         )
 
-        layers_and_log_jac_fns = []
         if depth == 0:
-            layers_and_log_jac_fns.append(
-                block_autoregressive_linear(
-                    key,
-                    n_blocks=dim,
-                    block_shape=(1, 1),
-                ),
-            )
+            layers = [
+                block_autoregressive_linear(key, n_blocks=dim, block_shape=(1, 1))
+            ]
+            hidden_layers = None
         else:
             keys = random.split(key, depth + 1)
-
-            block_shapes = [
-                (block_dim, 1),
-                *[(block_dim, block_dim)] * (depth - 1),
-                (1, block_dim),
+            layers = [
+                block_autoregressive_linear(
+                    keys[0], n_blocks=dim, block_shape=(block_dim, 1)
+                ),
+                block_autoregressive_linear(
+                    keys[-1], n_blocks=dim, block_shape=(1, block_dim)
+                ),
             ]
-
-            for layer_key, block_shape in zip(keys, block_shapes, strict=True):
-                layers_and_log_jac_fns.append(
-                    block_autoregressive_linear(
-                        layer_key,
+            # The hidden layers share a shape, so we stack them to allow scanning
+            hidden_layers = (
+                eqx.filter_vmap(
+                    partial(
+                        block_autoregressive_linear,
                         n_blocks=dim,
-                        block_shape=block_shape,
-                    ),
-                )
+                        block_shape=(block_dim, block_dim),
+                    )
+                )(keys[1:-1])
+                if depth > 1
+                else None
+            )
 
         if cond_dim is not None:
-            layer0_out_dim = layers_and_log_jac_fns[0][0].out_features
+            layer0_out_dim = layers[0][0].out_features
             self.cond_linear = eqx.nn.Linear(
                 cond_dim, layer0_out_dim, use_bias=False, key=subkey
             )
@@ -142,40 +150,52 @@ class BlockAutoregressiveNetwork(AbstractBijection):
             self.cond_linear = None
 
         self.depth = depth
-        self.layers = layers_and_log_jac_fns
+        self.layers = layers
+        self.hidden_layers = hidden_layers
         self.block_dim = block_dim
         self.shape = (dim,)
         self.cond_shape = None if cond_dim is None else (cond_dim,)
         self.activation = activation
 
     def transform(self, x, condition=None):
-        for i, (layer, _) in enumerate(self.layers[:-1]):
-            x = layer(x)
-            if i == 0 and condition is not None:
-                assert self.cond_linear is not None
-                x += self.cond_linear(condition)
+        if self.depth > 0:
+            x = self._first_linear(x, condition)
             x = eqx.filter_vmap(self.activation.transform)(x)
+
+        if self.hidden_layers is not None:
+
+            def step(x, linear):
+                return eqx.filter_vmap(self.activation.transform)(linear(x)), None
+
+            x, _ = _filter_scan(step, x, self.hidden_layers[0])
         return self.layers[-1][0](x)
 
     def transform_and_log_det(self, x, condition=None):
-        log_dets_3ds = []
-        for i, (linear, log_jacobian_fn) in enumerate(self.layers[:-1]):
-            x = linear(x)
-            if i == 0 and condition is not None:
-                assert self.cond_linear is not None
-                x += self.cond_linear(condition)
-            log_dets_3ds.append(log_jacobian_fn(linear))
-            x, log_det_3d = self._activation_and_log_jacobian_3d(x)
-            log_dets_3ds.append(log_det_3d)
+        # We accumulate the block log jacobians as we pass through the network, so the
+        # carried log jacobian has shape (dim, block_dim, 1) (or (dim, 1, 1) at the end)
+        if self.depth == 0:
+            linear, log_jacobian_fn = self.layers[0]
+            return linear(x), log_jacobian_fn(linear).sum()
+
+        first_linear, first_log_jacobian_fn = self.layers[0]
+        x = self._first_linear(x, condition)
+        x, log_det = self._activation_and_log_jacobian(
+            x, first_log_jacobian_fn(first_linear)
+        )
 
-        linear, log_jacobian_fn = self.layers[-1]
-        x = linear(x)
-        log_dets_3ds.append(log_jacobian_fn(linear))
+        if self.hidden_layers is not None:
+            hidden_log_jacobian_fn = self.hidden_layers[1]
+
+            def step(carry, linear):
+                x, log_det = carry
+                log_det = logmatmulexp(hidden_log_jacobian_fn(linear), log_det)
+                return self._activation_and_log_jacobian(linear(x), log_det), None
 
-        log_det = log_dets_3ds[-1]
-        for log_jacobian in reversed(log_dets_3ds[:-1]):
-            log_det = logmatmulexp(log_det, log_jacobian)
-        return x, log_det.sum()
+            (x, log_det), _ = _filter_scan(step, (x, log_det), self.hidden_layers[0])
+
+        linear, log_jacobian_fn = self.layers[-1]
+        log_det = logmatmulexp(log_jacobian_fn(linear), log_det)
+        return linear(x), log_det.sum()
 
     def inverse(self, y, condition=None):
         return self.inverter(self, y, condition)
@@ -185,15 +205,19 @@ class BlockAutoregressiveNetwork(AbstractBijection):
         _, forward_log_det = self.transform_and_log_det(x, condition)
         return x, -forward_log_det
 
-    def _activation_and_log_jacobian_3d(self, x):
-        """Compute activation and the log determinant (blocks, block_dim, block_dim)."""
+    def _first_linear(self, x, condition):
+        x = self.layers[0][0](x)
+        if condition is not None:
+            assert self.cond_linear is not None
+            x += self.cond_linear(condition)
+        return x
+
+    def _activation_and_log_jacobian(self, x, log_jacobian):
+        """Apply the activation, accumulating its jacobian into the log jacobian."""
         x, log_abs_grads = eqx.filter_vmap(self.activation.transform_and_log_det)(x)
-        log_det_3d = jnp.full((self.shape[0], self.block_dim, self.block_dim), -jnp.inf)
-        diag_idxs = jnp.arange(self.block_dim)
-        log_det_3d = log_det_3d.at[:, diag_idxs, diag_idxs].set(
-            log_abs_grads.reshape(self.shape[0], self.block_dim)
-        )
-        return x, log_det_3d
+        # The activation jacobian is diagonal, so multiplying by it scales rows
+        log_abs_grads = log_abs_grads.reshape(self.shape[0], self.block_dim, 1)
+        return x, log_jacobian + log_abs_grads
 
 
 def block_autoregressive_linear(
@@ -226,9 +250,11 @@ def block_autoregressive_linear(
     weight = WeightNormalization(Parameterize(apply_mask, linear.weight))
     linear = eqx.tree_at(lambda linear: linear.weight, linear, replace=weight)
 
+    # Computed once here, rather than each time the log jacobian is computed
+    block_diag_idxs = jnp.where(block_diag_mask, size=prod(block_shape) * n_blocks)
+
     def linear_to_log_block_diagonal(linear: eqx.nn.Linear):
-        idxs = jnp.where(block_diag_mask, size=prod(block_shape) * n_blocks)
-        jac_3d = linear.weight[idxs].reshape(n_blocks, *block_shape)
+        jac_3d = linear.weight[block_diag_idxs].reshape(n_blocks, *block_shape)
         return jnp.log(jac_3d)
 
     return linear, linear_to_log_block_diagonal
@@ -237,10 +263,7 @@ def block_autoregressive_linear(
 def logmatmulexp(x, y):
     """Numerically stable version of ``(x.log() @ y.log()).exp()``.
 
-    From numpyro https://github.com/pyro-ppl/numpyro/blob/
-    f2ff89a3a7147617e185eb51148eb15d56d44661/numpyro/distributions/util.py#L387.
+    Computed as a single logsumexp reduction over the shared axis, which avoids
+    materializing the exponentiated operands and allows XLA to fuse the computation.
     """
-    x_shift = jax.lax.stop_gradient(jnp.amax(x, -1, keepdims=True))
-    y_shift = jax.lax.stop_gradient(jnp.amax(y, -2, keepdims=True))
-    xy = jnp.log(jnp.matmul(jnp.exp(x - x_shift), jnp.exp(y - y_shift)))
-    return xy + x_shift + y_shift
+    return jax.nn.logsumexp(x[..., :, :, None] + y[..., None, :, :], axis=-2)
@@ -2,6 +2,8 @@
 
 from collections.abc import Sequence
 
+import jax.numpy as jnp
+
 from flowjax.bijections.bijection import AbstractBijection
 from flowjax.utils import check_shapes_match, merge_cond_shapes
 from flowjax.wrappers import AbstractUnwrappable, unwrap
@@ -37,7 +39,7 @@ class Chain(AbstractBijection):
         return x
 
     def transform_and_log_det(self, x, condition=None):
-        log_abs_det_jac = 0
+        log_abs_det_jac = jnp.zeros(())
         for bijection in self.bijections:
             x, log_abs_det_jac_i = bijection.transform_and_log_det(x, condition)
             log_abs_det_jac += log_abs_det_jac_i.sum()
@@ -49,7 +51,7 @@ class Chain(AbstractBijection):
         return y
 
     def inverse_and_log_det(self, y, condition=None):
-        log_abs_det_jac = 0
+        log_abs_det_jac = jnp.zeros(())
         for bijection in reversed(self.bijections):
             y, log_abs_det_jac_i = bijection.inverse_and_log_det(y, condition)
             log_abs_det_jac += log_abs_det_jac_i.sum()
@@ -51,7 +51,7 @@ class Scan(AbstractBijection):
             y, log_det_i = bijection.transform_and_log_det(x, condition)
             return ((y, log_det + log_det_i.sum()), None)
 
-        (y, log_det), _ = _filter_scan(step, (x, 0), self.bijection)
+        (y, log_det), _ = _filter_scan(step, (x, jnp.zeros(())), self.bijection)
         return y, log_det
 
     def inverse(self, y, condition=None):
@@ -67,7 +67,9 @@ class Scan(AbstractBijection):
             x, log_det_i = bijection.inverse_and_log_det(y, condition)
             return ((x, log_det + log_det_i.sum()), None)
 
-        (y, log_det), _ = _filter_scan(step, (y, 0), self.bijection, reverse=True)
+        (y, log_det), _ = _filter_scan(
+            step, (y, jnp.zeros(())), self.bijection, reverse=True
+        )
         return y, log_det
 
     @property
@@ -336,5 +336,5 @@ def _add_default_permute(bijection: AbstractBijection, dim: int, key: PRNGKeyArr
     if dim == 2:
         return Chain([bijection, Flip((dim,))]).merge_chains()
 
-    perm = Permute(jr.permutation(key, jnp.arange(dim)))
+    perm = Permute(jr.permutation(key, jnp.arange(dim, dtype=jnp.int32)))
     return Chain([bijection, perm]).merge_chains()
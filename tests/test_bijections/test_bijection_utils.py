@@ -1,3 +1,4 @@
+import equinox as eqx
 import jax.numpy as jnp
 import pytest
 from equinox import EquinoxRuntimeError
@@ -32,3 +33,6 @@ def test_partial(idx, expected):
 def test_Permute_argcheck():
     with pytest.raises(EquinoxRuntimeError):
         Permute(jnp.array([0, 0]))
+
+    with pytest.raises(EquinoxRuntimeError):
+        eqx.filter_jit(lambda p: Permute(p))(jnp.array([0, 0]))
@@ -135,6 +135,18 @@ bijections = {
         block_dim=3,
         depth=1,
     ),
+    "BlockAutoregressiveNetwork (depth 0)": lambda: BlockAutoregressiveNetwork(
+        KEY,
+        dim=DIM,
+        block_dim=3,
+        depth=0,
+    ),
+    "BlockAutoregressiveNetwork (depth 3)": lambda: BlockAutoregressiveNetwork(
+        KEY,
+        dim=DIM,
+        block_dim=3,
+        depth=3,
+    ),
     "BlockAutoregressiveNetwork (conditional)": lambda: BlockAutoregressiveNetwork(
         KEY,
         dim=DIM,
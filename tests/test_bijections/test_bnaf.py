@@ -6,6 +6,7 @@ from jax import random
 from flowjax.bijections.block_autoregressive_network import (
     BlockAutoregressiveNetwork,
     block_autoregressive_linear,
+    logmatmulexp,
 )
 from flowjax.wrappers import unwrap
 
@@ -23,6 +24,13 @@ def test_block_autoregressive_linear():
     assert jnp.all(jnp.isfinite(log_jac_3d))
 
 
+def test_logmatmulexp():
+    x = random.normal(random.key(0), (4, 3, 2))
+    y = random.normal(random.key(1), (4, 2, 5))
+    expected = jnp.log(jnp.exp(x) @ jnp.exp(y))
+    assert logmatmulexp(x, y) == pytest.approx(expected, abs=1e-5)
+
+
 def test_BlockAutoregressiveNetwork():
     dim = 3
     x = jnp.ones(dim)
@@ -6,7 +6,15 @@ import jax.numpy as jnp
 import pytest
 from jax import random
 
-from flowjax.bijections import Affine, Chain, Coupling, Flip, Permute, Scan
+from flowjax.bijections import (
+    Affine,
+    Chain,
+    Coupling,
+    Flip,
+    Partial,
+    Permute,
+    Scan,
+)
 
 
 def test_chain_dunders():
@@ -80,3 +88,28 @@ def test_scan(name):
             [pytest.approx(a) == b for (a, b) in zip(expected, realised, strict=True)],
         ),
     )
+
+
+def test_chain_partial_bool_idxs():
+    # Boolean-mask Partial inside a Chain round-trips with a zero log det
+    mask = jnp.array([True, False, True, False])
+    chain = Chain([Partial(Affine(jnp.ones(2)), mask, (DIM,)) for _ in range(2)])
+    x = jnp.arange(DIM, dtype=float)
+    expected_y = jnp.array([2, 1, 4, 3])
+
+    y, log_det = chain.transform_and_log_det(x)
+    assert y == pytest.approx(expected_y)
+    assert log_det == pytest.approx(0)
+
+    x_reconstructed, log_det = chain.inverse_and_log_det(y)
+    assert x_reconstructed == pytest.approx(x)
+    assert log_det == pytest.approx(0)
+
+
+def test_flip_round_trip():
+    chain = Chain([Flip((DIM,)), Affine(jnp.ones(DIM)), Flip((DIM,))])
+    assert len(chain) == 3
+
+    x = jnp.arange(DIM, dtype=float)
+    assert chain.transform(x) == pytest.approx(x + 1)
+    assert chain.inverse(chain.transform(x)) == pytest.approx(x)